@@ -104,6 +104,7 @@ class BaseTestWithRecordings:
                     insert(FilesMeta).values(
                         path=f"/test/{filename}",
                         orig_ctime=timestamp,
+                        extinf=5,
                         meta={"m3u8": {"EXTINF": 5}},
                         created_at=timestamp,
                     )
@@ -126,6 +127,7 @@ class BaseTestWithRecordings:
                     insert(FilesMeta).values(
                         path=f"/test2/{filename}",
                         orig_ctime=timestamp,
+                        extinf=5,
                         meta={"m3u8": {"EXTINF": 5}},
                         created_at=timestamp,
                     )
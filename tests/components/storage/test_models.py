@@ -14,7 +14,7 @@ class TestRecordings(BaseTestWithRecordings):
         """Test get_files."""
         with self._get_db_session() as session:
             recording = session.query(Recordings).filter_by(id=3).one()
-        rows = recording.get_fragments(5, self._get_db_session)
+        rows = list(recording.get_fragments(5, self._get_db_session))
         assert len(rows) == 4
         assert rows[0].created_at == self._now + datetime.timedelta(seconds=20)
         assert rows[3].created_at == self._now + datetime.timedelta(seconds=35)
@@ -0,0 +1,123 @@
+"""Tests for the partition maintenance functions."""
+from __future__ import annotations
+
+import datetime
+from collections.abc import Callable
+
+import pytest
+from sqlalchemy import delete, insert, text
+from sqlalchemy.orm import Session
+
+from viseron.components.storage.models import Recordings
+from viseron.components.storage.partitions import (
+    create_monthly_partition,
+    create_partitions,
+    drop_empty_partitions,
+    get_monthly_partitions,
+    is_partition,
+    next_month_start,
+)
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("recordings_default", True),
+        ("recordings_2024_12", True),
+        ("objects_2025_01", True),
+        ("motion_2025_01", True),
+        ("files_2025_01", False),
+        ("recordings", False),
+        ("recordings_2025", False),
+    ],
+)
+def test_is_partition(name: str, expected: bool) -> None:
+    """Test is_partition."""
+    assert is_partition(name) == expected
+
+
+@pytest.mark.parametrize(
+    "timestamp, expected",
+    [
+        (
+            datetime.datetime(2024, 1, 31, 12, tzinfo=datetime.timezone.utc),
+            datetime.datetime(2024, 2, 1),
+        ),
+        (datetime.datetime(2024, 12, 1), datetime.datetime(2025, 1, 1)),
+    ],
+)
+def test_next_month_start(
+    timestamp: datetime.datetime, expected: datetime.datetime
+) -> None:
+    """Test next_month_start."""
+    assert next_month_start(timestamp) == expected
+
+
+def test_create_partitions(get_db_session: Callable[[], Session]) -> None:
+    """Test that rows are routed to the monthly partitions."""
+    now = datetime.datetime(2024, 12, 15, tzinfo=datetime.timezone.utc)
+    create_partitions(get_db_session, now)
+    # Running it again should be a noop
+    create_partitions(get_db_session, now)
+
+    with get_db_session() as session:
+        for start_time in (now, now + datetime.timedelta(days=20), now.replace(1999)):
+            session.execute(
+                insert(Recordings).values(
+                    camera_identifier="test",
+                    start_time=start_time,
+                    adjusted_start_time=start_time,
+                )
+            )
+        session.commit()
+        partitions = (
+            session.execute(
+                text("SELECT tableoid::regclass FROM recordings ORDER BY start_time")
+            )
+            .scalars()
+            .all()
+        )
+
+    assert partitions == [
+        "recordings_default",
+        "recordings_2024_12",
+        "recordings_2025_01",
+    ]
+
+
+def test_drop_empty_partitions(get_db_session: Callable[[], Session]) -> None:
+    """Test that empty partitions older than the oldest row are dropped."""
+    now = datetime.datetime(2024, 12, 15, tzinfo=datetime.timezone.utc)
+    create_partitions(get_db_session, now)
+    with get_db_session() as session:
+        for month in (9, 10, 11):
+            create_monthly_partition(
+                session, "recordings", datetime.datetime(2024, month, 1)
+            )
+        start_time = datetime.datetime(2024, 10, 5, tzinfo=datetime.timezone.utc)
+        session.execute(
+            insert(Recordings).values(
+                camera_identifier="test",
+                start_time=start_time,
+                adjusted_start_time=start_time,
+            )
+        )
+        session.commit()
+
+    drop_empty_partitions(get_db_session, now)
+    with get_db_session() as session:
+        assert [name for _, name in get_monthly_partitions(session, "recordings")] == [
+            "recordings_2024_10",
+            "recordings_2024_11",
+            "recordings_2024_12",
+            "recordings_2025_01",
+        ]
+        session.execute(delete(Recordings))
+        session.commit()
+
+    drop_empty_partitions(get_db_session, now)
+    with get_db_session() as session:
+        assert [name for _, name in get_monthly_partitions(session, "recordings")] == [
+            "recordings_2024_12",
+            "recordings_2025_01",
+        ]
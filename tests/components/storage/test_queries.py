@@ -1,7 +1,8 @@
 """Test the query functions."""
 import datetime
 
-from sqlalchemy import insert, update
+from sqlalchemy import event, insert, select, update
+from sqlalchemy.engine import Engine
 
 from viseron.components.storage.models import Files, FilesMeta, Recordings
 from viseron.components.storage.queries import (
@@ -267,13 +268,26 @@ class TestMoveQueries(BaseTestWithRecordings):
                 insert(FilesMeta).values(
                     path=f"/tier2/{filename}",
                     orig_ctime=timestamp,
+                    extinf=5,
                     meta={"m3u8": {"EXTINF": 5}},
                     created_at=created_at,
                 )
             )
             session.commit()
 
-        files = get_recording_fragments(3, 5, self._get_db_session)
+        with self._get_db_session() as session:
+            recording = session.execute(
+                select(Recordings).where(Recordings.id == 3)
+            ).scalar_one()
+        files = list(
+            get_recording_fragments(
+                recording.camera_identifier,
+                recording.start_time,
+                recording.end_time,
+                5,
+                self._get_db_session,
+            )
+        )
         assert len(files) == 4
         assert files[0].id == 9
         assert files[1].id == 31
@@ -281,6 +295,37 @@ class TestMoveQueries(BaseTestWithRecordings):
         assert files[2].id == 13
         assert files[3].id == 15
 
+    def test_get_recording_fragments_server_side_cursor(self):
+        """Test that get_recording_fragments fetches rows using a server side cursor."""
+        with self._get_db_session() as session:
+            recording = session.execute(
+                select(Recordings).where(Recordings.id == 3)
+            ).scalar_one()
+        cursor_names = []
+
+        def before_cursor_execute(
+            _conn, cursor, _statement, _parameters, _context, _executemany
+        ):
+            cursor_names.append(cursor.name)
+
+        event.listen(Engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            files = list(
+                get_recording_fragments(
+                    recording.camera_identifier,
+                    recording.start_time,
+                    recording.end_time,
+                    5,
+                    self._get_db_session,
+                )
+            )
+        finally:
+            event.remove(Engine, "before_cursor_execute", before_cursor_execute)
+
+        assert len(files) == 4
+        assert cursor_names
+        assert all(name is not None for name in cursor_names)
+
     def test_get_time_period_fragments(self):
         """Test get_recording_fragments."""
         with self._get_db_session() as session:
@@ -307,6 +352,7 @@ class TestMoveQueries(BaseTestWithRecordings):
                 insert(FilesMeta).values(
                     path=f"/tier2/{filename}",
                     orig_ctime=timestamp,
+                    extinf=5,
                     meta={"m3u8": {"EXTINF": 5}},
                     created_at=created_at,
                 )
@@ -334,18 +380,21 @@ class TestMoveQueries(BaseTestWithRecordings):
                 insert(FilesMeta).values(
                     path=f"/tier1/{filename}",
                     orig_ctime=timestamp,
+                    extinf=None,
                     meta={"m3u8": {"EXTINF": None}},
                     created_at=created_at,
                 )
             )
             session.commit()
 
-        files = get_time_period_fragments(
-            ["test"],
-            0,
-            None,
-            self._get_db_session,
-            self._now + datetime.timedelta(days=365),
+        files = list(
+            get_time_period_fragments(
+                ["test"],
+                0,
+                None,
+                self._get_db_session,
+                self._now + datetime.timedelta(days=365),
+            )
         )
         assert len(files) == 15
         assert files[4].tier_id == 0
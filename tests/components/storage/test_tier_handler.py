@@ -1,10 +1,13 @@
 """Test the TierHandler class."""
 
+import os
+from collections.abc import Callable
 from dataclasses import dataclass
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
-from sqlalchemy import select
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
 
 from viseron import Viseron
 from viseron.components.storage import Storage
@@ -12,14 +15,16 @@ from viseron.components.storage.const import (
     COMPONENT as STORAGE_COMPONENT,
     CONFIG_RECORDER,
 )
-from viseron.components.storage.models import Recordings
+from viseron.components.storage.models import Files, FilesMeta, Recordings
 from viseron.components.storage.tier_handler import (
     RecordingsTierHandler,
     SegmentsTierHandler,
     ThumbnailTierHandler,
+    delete_files,
     find_next_tier_segments,
     handle_file,
 )
+from viseron.components.storage.triggers import setup_triggers
 from viseron.domains.camera.const import CONFIG_LOOKBACK
 
 from tests.common import BaseTestWithRecordings
@@ -43,6 +48,83 @@ def test_handle_file_delete(
     mock_delete_file.assert_called_once_with(session, file, logger)
 
 
+def test_delete_files(get_db_session: Callable[[], Session], tmp_path) -> None:
+    """Test delete_files."""
+    paths = [str(tmp_path / f"file{i}.jpg") for i in range(3)]
+    with get_db_session() as session:
+        for path in paths:
+            with open(path, "w", encoding="utf-8"):
+                pass
+            session.execute(
+                insert(Files).values(
+                    tier_id=0,
+                    tier_path=str(tmp_path),
+                    camera_identifier="test",
+                    category="recorder",
+                    subcategory="thumbnails",
+                    path=path,
+                    directory=str(tmp_path),
+                    filename=os.path.basename(path),
+                    size=0,
+                )
+            )
+        session.commit()
+
+    logger = MagicMock()
+    delete_files(get_db_session, paths[:2] + [str(tmp_path / "missing.jpg")], logger)
+
+    with get_db_session() as session:
+        assert session.execute(select(Files.path)).scalars().all() == [paths[2]]
+    assert os.listdir(tmp_path) == ["file2.jpg"]
+    logger.error.assert_called_once()
+
+
+def test_delete_files_files_meta(
+    get_db_session: Callable[[], Session], tmp_path
+) -> None:
+    """Test that delete_files also deletes the FilesMeta rows using the triggers."""
+    setup_triggers(get_db_session.kw["bind"])
+    paths = [str(tmp_path / f"file{i}.jpg") for i in range(3)]
+    with get_db_session() as session:
+        for path in paths:
+            session.execute(
+                insert(Files).values(
+                    tier_id=0,
+                    tier_path=str(tmp_path),
+                    camera_identifier="test",
+                    category="recorder",
+                    subcategory="thumbnails",
+                    path=path,
+                    directory=str(tmp_path),
+                    filename=os.path.basename(path),
+                    size=0,
+                )
+            )
+        session.commit()
+
+    with get_db_session() as session:
+        assert len(session.execute(select(FilesMeta.path)).scalars().all()) == 3
+
+    delete_files(get_db_session, paths, MagicMock())
+
+    with get_db_session() as session:
+        assert session.execute(select(Files.path)).scalars().all() == []
+        assert session.execute(select(FilesMeta.path)).scalars().all() == []
+
+
+@patch("viseron.components.storage.tier_handler.os.remove")
+def test_delete_files_os_error(
+    mock_os_remove: Mock, get_db_session: Callable[[], Session]
+) -> None:
+    """Test that delete_files logs errors when removing files instead of raising."""
+    mock_os_remove.side_effect = [PermissionError("denied"), None]
+    logger = MagicMock()
+    delete_files(get_db_session, ["/tmp/file1.jpg", "/tmp/file2.jpg"], logger)
+
+    assert mock_os_remove.call_count == 2
+    logger.error.assert_called_once()
+
+
 @patch("viseron.components.storage.tier_handler.move_file")
 def test_handle_file_move(
     mock_move_file: Mock,
@@ -140,6 +140,35 @@ class TestBaseAPIHandler(TestAppBaseAuth):
             "status": HTTPStatus.NOT_FOUND,
         }
 
+    def test_path_patterns_compiled_once(self):
+        """Test that route path patterns are not recompiled per request."""
+        compiled_routes = (
+            DummyAPIHandler._compiled_routes  # pylint: disable=protected-access
+        )
+        assert len(compiled_routes) == len(DummyAPIHandler.routes)
+        assert all(
+            isinstance(compiled_route.supported_methods, frozenset)
+            for compiled_route in compiled_routes
+        )
+        assert compiled_routes[0].method == "test_get"
+        assert compiled_routes[0].requires_auth is True
+        assert compiled_routes[0].requires_camera_token is False
+        with patch("tornado.routing.PathMatches") as mock_path_matches:
+            response = self.fetch("/api/v1/no_auth", method="GET")
+        assert response.code == HTTPStatus.OK
+        mock_path_matches.assert_not_called()
+
+    def test_request_arguments_schemas_compiled_once(self):
+        """Test that token parameter schemas are not extended per request."""
+        with patch.object(vol.Schema, "extend") as mock_extend:
+            response = self.fetch_with_auth(
+                "/api/v1/allow_token_parameter?test_key=test",
+                method="GET",
+                token_parameter=True,
+            )
+        assert response.code == HTTPStatus.OK
+        mock_extend.assert_not_called()
+
     def test_invalid_auth(self):
         """Test endpoint with requires auth setting."""
         response = self.fetch("/api/v1/test", method="GET")
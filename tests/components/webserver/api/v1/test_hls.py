@@ -160,6 +160,7 @@ class TestHlsApiHandler(TestAppBaseNoAuth, BaseTestWithRecordings):
                     insert(FilesMeta).values(
                         path=f"/test/{filename}",
                         orig_ctime=timestamp,
+                        extinf=5,
                         meta={"m3u8": {"EXTINF": 5}},
                         created_at=timestamp,
                     )
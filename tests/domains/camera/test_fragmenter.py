@@ -136,6 +136,58 @@ class TestFragmenter:
         )
         assert mock_shutil_move.call_count == 2
 
+    def test_create_fragmented_mp4_writes_metadata_once(self):
+        """Test that the metadata of all handled files is written in one batch."""
+        # pylint: disable=protected-access
+        for file in ("init.mp4", "1723111140.m4s", "1723111146.m4s", "1723111150.m4s"):
+            with open(
+                os.path.join(self.camera.temp_segments_folder, file),
+                "w",
+                encoding="utf-8",
+            ):
+                pass
+
+        with patch.object(
+            self.fragmenter, "_read_m3u8", return_value=PLAYLIST_CONTENT
+        ), patch(
+            "viseron.domains.camera.fragmenter._get_mp4_files_to_fragment",
+            return_value=["1723111140.m4s", "1723111146.m4s", "1723111150.m4s"],
+        ), patch.object(
+            self.fragmenter, "_write_files_metadata"
+        ) as mock_write_files_metadata:
+            self.fragmenter._create_fragmented_mp4()
+
+        mock_write_files_metadata.assert_called_once()
+        files_metadata = mock_write_files_metadata.call_args[0][0]
+        assert [metadata["extinf"] for metadata in files_metadata] == [
+            6.001628,
+            4.010498,
+            5.957438,
+        ]
+        assert sorted(os.listdir(self.camera.segments_folder)) == [
+            "1723111140.m4s",
+            "1723111146.m4s",
+            "1723111150.m4s",
+            "init.mp4",
+        ]
+        assert os.listdir(self.camera.temp_segments_folder) == ["init.mp4"]
+
+    def test_move_fragments_continues_on_error(self):
+        """Test that a file failing to move does not stop the remaining moves."""
+        # pylint: disable=protected-access
+        files = ["1723111140.m4s", "1723111146.m4s", "1723111150.m4s"]
+        with patch.object(
+            self.fragmenter,
+            "_move_to_segments_folder",
+            side_effect=[None, PermissionError("denied"), None],
+        ) as mock_move, patch.object(
+            self.fragmenter, "_cleanup_fragment"
+        ) as mock_cleanup:
+            self.fragmenter._move_fragments(files)
+
+        assert [call.args[0] for call in mock_move.call_args_list] == files
+        assert [call.args[0] for call in mock_cleanup.call_args_list] == files
+
 
 def test_extract_extinf_number():
     """Test _extract_extinf_number."""
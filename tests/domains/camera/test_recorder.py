@@ -15,6 +15,7 @@ from viseron.domains.camera.recorder import (
     RecorderBase,
     delete_recordings,
     get_recordings,
+    get_recordings_multiple_cameras,
 )
 
 from tests.common import MockCamera
@@ -165,6 +166,45 @@ def test_get_recordings_date_latest(
     )
 
 
+def test_get_recordings_multiple_cameras(
+    get_db_session_recordings: Callable[[], Session]
+) -> None:
+    """Test get_recordings_multiple_cameras."""
+    recordings = get_recordings_multiple_cameras(
+        get_db_session_recordings, ["test1", "test2"]
+    )
+    assert recordings["test2"] == {}
+    assert recordings["test1"] == get_recordings(get_db_session_recordings, "test1")
+    assert list(recordings["test1"]["2023-03-03"]) == [6, 5]
+
+
+def test_get_recordings_multiple_cameras_latest(
+    get_db_session_recordings: Callable[[], Session]
+) -> None:
+    """Test get_recordings_multiple_cameras with latest."""
+    recordings = get_recordings_multiple_cameras(
+        get_db_session_recordings, ["test1", "test2"], latest=True
+    )
+    assert recordings["test2"] == {}
+    assert recordings["test1"] == get_recordings(
+        get_db_session_recordings, "test1", latest=True
+    )
+
+
+def test_get_recordings_multiple_cameras_latest_daily(
+    get_db_session_recordings: Callable[[], Session]
+) -> None:
+    """Test get_recordings_multiple_cameras with latest and daily."""
+    recordings = get_recordings_multiple_cameras(
+        get_db_session_recordings, ["test1", "test2"], latest=True, daily=True
+    )
+    assert recordings["test2"] == {}
+    assert recordings["test1"] == get_recordings(
+        get_db_session_recordings, "test1", latest=True, daily=True
+    )
+    assert list(recordings["test1"]) == ["2023-03-03", "2023-03-02", "2023-03-01"]
+
+
 def test_delete_recordings_single(get_db_session_recordings: Callable[[], Session]):
     """Test deleting a single recording."""
     recordings = delete_recordings(get_db_session_recordings, "test1", recording_id=1)
@@ -211,10 +251,12 @@ class Recorder(RecorderBase):
 class TestRecorderBase:
     """Test the RecorderBase class."""
 
+    @patch("viseron.components.storage.tier_handler.delete_files")
     @patch("viseron.domains.camera.recorder.delete_recordings")
     def test_delete_recording(
         self,
         mock_delete_recording: Mock,
+        mock_delete_files: Mock,
         vis: Viseron,
     ):
         """Test delete_recording."""
@@ -224,8 +266,84 @@ class TestRecorderBase:
         assert result is False
 
         mock_delete_recording.return_value = [
-            MagicMock(spec=Recordings),
-            MagicMock(spec=Recordings),
+            MagicMock(spec=Recordings, thumbnail_path="/thumb/1.jpg", clip_path=None),
+            MagicMock(
+                spec=Recordings, thumbnail_path="/thumb/2.jpg", clip_path="/clip/2.mp4"
+            ),
         ]
         result = recorder_base.delete_recording()
         assert result is True
+        assert mock_delete_files.call_args[0][1] == [
+            "/thumb/1.jpg",
+            "/thumb/2.jpg",
+            "/clip/2.mp4",
+        ]
+
+    @patch("viseron.domains.camera.recorder.get_recordings")
+    def test_get_latest_recording_cached(
+        self,
+        mock_get_recordings: Mock,
+        vis: Viseron,
+    ):
+        """Test that the latest recording is cached until invalidated or expired."""
+        mock_get_recordings.return_value = {}
+        recorder_base = Recorder(vis, MagicMock(), MockCamera())
+
+        with patch("viseron.domains.camera.recorder.time.monotonic") as mock_time:
+            mock_time.return_value = 100
+            recorder_base.get_latest_recording()
+            recorder_base.get_latest_recording()
+            assert mock_get_recordings.call_count == 1
+
+            recorder_base.get_latest_recording_daily()
+            assert mock_get_recordings.call_count == 2
+
+            recorder_base.invalidate_latest_recording_cache()
+            recorder_base.get_latest_recording()
+            assert mock_get_recordings.call_count == 3
+
+            mock_time.return_value = 200
+            recorder_base.get_latest_recording()
+            assert mock_get_recordings.call_count == 4
+
+    @patch("viseron.domains.camera.recorder.get_recordings")
+    def test_get_latest_recording_invalidated_during_query(
+        self,
+        mock_get_recordings: Mock,
+        vis: Viseron,
+    ):
+        """Test that a result is not cached if invalidated while being queried."""
+        recorder_base = Recorder(vis, MagicMock(), MockCamera())
+
+        def _get_recordings_and_invalidate(*_args, **_kwargs):
+            recorder_base.invalidate_latest_recording_cache()
+            return {}
+
+        mock_get_recordings.side_effect = _get_recordings_and_invalidate
+        recorder_base.get_latest_recording()
+        mock_get_recordings.side_effect = None
+        mock_get_recordings.return_value = {}
+        recorder_base.get_latest_recording()
+        assert mock_get_recordings.call_count == 2
+        recorder_base.get_latest_recording()
+        assert mock_get_recordings.call_count == 2
+
+    @patch("viseron.components.storage.tier_handler.delete_files")
+    @patch("viseron.domains.camera.recorder.delete_recordings")
+    @patch("viseron.domains.camera.recorder.get_recordings")
+    def test_delete_recording_invalidates_cache(
+        self,
+        mock_get_recordings: Mock,
+        mock_delete_recordings: Mock,
+        _mock_delete_files: Mock,
+        vis: Viseron,
+    ):
+        """Test that deleting recordings invalidates the latest recording cache."""
+        mock_get_recordings.return_value = {}
+        mock_delete_recordings.return_value = []
+        recorder_base = Recorder(vis, MagicMock(), MockCamera())
+
+        recorder_base.get_latest_recording()
+        recorder_base.delete_recording()
+        recorder_base.get_latest_recording()
+        assert mock_get_recordings.call_count == 2
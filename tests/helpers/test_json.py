@@ -0,0 +1,30 @@
+"""Test the JSON helpers."""
+import json
+
+import numpy as np
+
+from viseron.helpers.json import orjson_dumps
+
+
+def test_orjson_dumps():
+    """Test that orjson_dumps produces the same JSON as json.dumps."""
+    obj = {"m3u8": {"EXTINF": 5.005}, 1: [1, "a", None, True]}
+    assert json.loads(orjson_dumps(obj)) == json.loads(json.dumps(obj))
+    assert isinstance(orjson_dumps(obj), str)
+
+
+def test_orjson_dumps_numpy():
+    """Test that orjson_dumps serializes numpy values."""
+    obj = {"confidence": np.float64(0.9)}
+    assert json.loads(orjson_dumps(obj)) == json.loads(json.dumps(obj))
+
+    obj = {
+        "confidence": np.float32(0.5),
+        "count": np.int64(3),
+        "bbox": np.array([1, 2, 3, 4]),
+    }
+    assert json.loads(orjson_dumps(obj)) == {
+        "confidence": 0.5,
+        "count": 3,
+        "bbox": [1, 2, 3, 4],
+    }
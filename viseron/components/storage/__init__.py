@@ -8,6 +8,7 @@ import pathlib
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any, Literal, TypedDict
 
+import orjson
 import voluptuous as vol
 from alembic import command, script
 from alembic.config import Config
@@ -35,6 +36,10 @@ from viseron.components.storage.const import (
     DESC_COMPONENT,
 )
 from viseron.components.storage.models import Base, Motion, Recordings
+from viseron.components.storage.partitions import (
+    create_partitions,
+    drop_empty_partitions,
+)
 from viseron.components.storage.tier_handler import (
     RecordingsTierHandler,
     SegmentsTierHandler,
@@ -51,6 +56,7 @@ from viseron.components.storage.util import (
 from viseron.const import EVENT_DOMAIN_REGISTERED, VISERON_SIGNAL_STOPPING
 from viseron.domains.camera.const import CONFIG_STORAGE, DOMAIN as CAMERA_DOMAIN
 from viseron.helpers import utcnow
+from viseron.helpers.json import orjson_dumps
 from viseron.helpers.logs import StreamToLogger
 
 if TYPE_CHECKING:
@@ -189,6 +195,22 @@ class Storage:
         self._alembic_cfg = self._get_alembic_config()
         self.create_database()
         setup_triggers(self.engine)
+        self._vis.background_scheduler.add_job(
+            create_partitions,
+            "interval",
+            days=1,
+            args=[self.get_session],
+            id="storage_create_partitions",
+            max_instances=1,
+        )
+        self._vis.background_scheduler.add_job(
+            drop_empty_partitions,
+            "interval",
+            days=1,
+            args=[self.get_session],
+            id="storage_drop_empty_partitions",
+            max_instances=1,
+        )
 
         self._vis.listen_event(
             EVENT_DOMAIN_REGISTERED.format(domain=CAMERA_DOMAIN),
@@ -234,7 +256,10 @@ class Storage:
     def create_database(self) -> None:
         """Create database."""
         self.engine = create_engine(
-            DATABASE_URL, connect_args={"options": "-c timezone=UTC"}
+            DATABASE_URL,
+            connect_args={"options": "-c timezone=UTC"},
+            json_serializer=orjson_dumps,
+            json_deserializer=orjson.loads,
         )
 
         conn = self.engine.connect()
@@ -250,6 +275,7 @@ class Storage:
             self._run_migrations()
 
         self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
+        create_partitions(self._get_session)
         startup_chores(self._get_session)
 
     def get_session(self) -> Session:
@@ -8,6 +8,7 @@ from sqlalchemy import engine_from_config, pool
 
 from viseron.components.storage.const import DATABASE_URL
 from viseron.components.storage.models import Base
+from viseron.components.storage.partitions import is_partition
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -31,6 +32,13 @@ target_metadata = Base.metadata
 config.set_main_option("sqlalchemy.url", DATABASE_URL)
 
 
+def include_name(name, type_, _parent_names) -> bool:
+    """Exclude partitions from autogenerate since they are not part of the models."""
+    if type_ == "table":
+        return not is_partition(name)
+    return True
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -48,6 +56,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         compare_type=True,
         compare_server_default=True,
+        include_name=include_name,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -78,6 +87,7 @@ def run_migrations_online() -> None:
             target_metadata=target_metadata,
             compare_type=True,
             compare_server_default=True,
+            include_name=include_name,
         )
 
         with context.begin_transaction():
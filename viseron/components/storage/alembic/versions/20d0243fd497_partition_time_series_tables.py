@@ -0,0 +1,102 @@
+# pylint: disable=invalid-name
+"""Partition time series tables by month.
+
+The recordings, objects and motion tables are recreated as partitioned tables with
+one partition per month that holds existing data, plus a DEFAULT partition.
+
+Revision ID: 20d0243fd497
+Revises: c15f6a5c975d
+Create Date: 2026-10-15 09:02:47.530194
+
+"""
+from __future__ import annotations
+
+import datetime
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str | None = "20d0243fd497"
+down_revision: str | None = "c15f6a5c975d"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+# Table name and the column it is partitioned on
+PARTITIONED_TABLES = {
+    "recordings": "start_time",
+    "objects": "created_at",
+    "motion": "start_time",
+}
+
+
+def _month_start(timestamp: datetime.datetime) -> datetime.datetime:
+    return timestamp.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _next_month_start(timestamp: datetime.datetime) -> datetime.datetime:
+    return _month_start(_month_start(timestamp) + datetime.timedelta(days=32))
+
+
+def _create_monthly_partitions(table: str, column: str) -> None:
+    """Create a partition for each month with rows, and the current and next month.
+
+    Months without rows are skipped, since empty partitions still have to be probed
+    by lookups that can not be pruned on the partition key.
+    """
+    connection = op.get_bind()
+    months = set(
+        connection.execute(
+            sa.text(
+                f"SELECT DISTINCT date_trunc('month', {column}) FROM {table}_old "
+                f"WHERE {column} IS NOT NULL"
+            )
+        ).scalars()
+    )
+    now = datetime.datetime.utcnow()
+    months.update((_month_start(now), _next_month_start(now)))
+
+    for month in sorted(months):
+        op.execute(
+            f"CREATE TABLE {table}_{month:%Y_%m} PARTITION OF {table} "
+            f"FOR VALUES FROM ('{month:%Y-%m-%d}') "
+            f"TO ('{_next_month_start(month):%Y-%m-%d}')"
+        )
+
+
+def _recreate_table(table: str, primary_key: list[str], partition_by: str = "") -> None:
+    """Recreate table with a new primary key and partitioning, keeping all rows."""
+    op.execute(f"ALTER TABLE {table} RENAME TO {table}_old")
+    op.execute(
+        f"ALTER TABLE {table}_old RENAME CONSTRAINT {table}_pkey TO {table}_old_pkey"
+    )
+    op.execute(
+        f"CREATE TABLE {table} (LIKE {table}_old INCLUDING DEFAULTS) {partition_by}"
+    )
+    op.execute(f"ALTER TABLE {table} ADD PRIMARY KEY ({', '.join(primary_key)})")
+    if partition_by:
+        op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+        _create_monthly_partitions(table, primary_key[1])
+    op.execute(f"INSERT INTO {table} SELECT * FROM {table}_old")
+    # The id sequence would otherwise be dropped together with the old table
+    op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id")
+    op.execute(f"DROP TABLE {table}_old")
+
+
+def upgrade() -> None:
+    """Run the upgrade migrations."""
+    # Columns in the primary key cannot be NULL
+    op.execute(
+        "UPDATE objects "
+        "SET created_at = COALESCE(updated_at, TIMEZONE('utc', CURRENT_TIMESTAMP)) "
+        "WHERE created_at IS NULL"
+    )
+    for table, column in PARTITIONED_TABLES.items():
+        _recreate_table(table, ["id", column], f"PARTITION BY RANGE ({column})")
+
+
+def downgrade() -> None:
+    """Run the downgrade migrations."""
+    for table in PARTITIONED_TABLES:
+        _recreate_table(table, ["id"])
+    op.alter_column("objects", "created_at", nullable=True)
@@ -0,0 +1,39 @@
+# pylint: disable=invalid-name
+"""Add covering index for recorder segments.
+
+Revision ID: 28c8192bbcdb
+Revises: 20d0243fd497
+Create Date: 2026-10-15 09:41:03.872311
+
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str | None = "28c8192bbcdb"
+down_revision: str | None = "20d0243fd497"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    """Run the upgrade migrations."""
+    op.create_index(
+        "ix_files_recorder_segments",
+        "files",
+        ["camera_identifier", "path"],
+        unique=False,
+        postgresql_include=["id", "tier_id", "filename", "created_at"],
+        postgresql_where=sa.text("category = 'recorder' AND subcategory = 'segments'"),
+    )
+
+
+def downgrade() -> None:
+    """Run the downgrade migrations."""
+    op.drop_index(
+        "ix_files_recorder_segments",
+        table_name="files",
+        postgresql_where=sa.text("category = 'recorder' AND subcategory = 'segments'"),
+    )
@@ -0,0 +1,39 @@
+# pylint: disable=invalid-name
+"""Drop covering index for recorder segments.
+
+Revision ID: 3d9e1f6a2b47
+Revises: 7c2e5a0f3d18
+Create Date: 2026-10-15 14:02:37.118204
+
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str | None = "3d9e1f6a2b47"
+down_revision: str | None = "7c2e5a0f3d18"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    """Run the upgrade migrations."""
+    op.drop_index(
+        "ix_files_recorder_segments",
+        table_name="files",
+        postgresql_where=sa.text("category = 'recorder' AND subcategory = 'segments'"),
+    )
+
+
+def downgrade() -> None:
+    """Run the downgrade migrations."""
+    op.create_index(
+        "ix_files_recorder_segments",
+        "files",
+        ["camera_identifier", "path"],
+        unique=False,
+        postgresql_include=["id", "tier_id", "filename", "created_at"],
+        postgresql_where=sa.text("category = 'recorder' AND subcategory = 'segments'"),
+    )
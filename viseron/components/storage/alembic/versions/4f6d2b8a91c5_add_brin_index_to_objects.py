@@ -0,0 +1,39 @@
+# pylint: disable=invalid-name
+"""Add BRIN index on objects created_at.
+
+Revision ID: 4f6d2b8a91c5
+Revises: 9a41c3d7e0b2
+Create Date: 2026-10-15 11:48:12.604417
+
+"""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str | None = "4f6d2b8a91c5"
+down_revision: str | None = "9a41c3d7e0b2"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    """Run the upgrade migrations."""
+    op.create_index(
+        "ix_objects_created_at_brin",
+        "objects",
+        ["created_at"],
+        unique=False,
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+    )
+
+
+def downgrade() -> None:
+    """Run the downgrade migrations."""
+    op.drop_index(
+        "ix_objects_created_at_brin",
+        table_name="objects",
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+    )
@@ -0,0 +1,38 @@
+# pylint: disable=invalid-name
+"""Add path_hash to files.
+
+Revision ID: 7c2e5a0f3d18
+Revises: 4f6d2b8a91c5
+Create Date: 2026-10-15 13:20:51.336082
+
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str | None = "7c2e5a0f3d18"
+down_revision: str | None = "4f6d2b8a91c5"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    """Run the upgrade migrations."""
+    op.add_column("files", sa.Column("path_hash", sa.LargeBinary(32), nullable=True))
+    op.execute("UPDATE files SET path_hash = sha256(convert_to(path, 'UTF8'))")
+    op.alter_column("files", "path_hash", nullable=False)
+    op.create_unique_constraint("files_path_hash_key", "files", ["path_hash"])
+    op.drop_constraint("files_path_key", "files", type_="unique")
+    op.create_index(
+        "ix_files_path", "files", ["path"], unique=False, postgresql_using="hash"
+    )
+
+
+def downgrade() -> None:
+    """Run the downgrade migrations."""
+    op.drop_index("ix_files_path", table_name="files", postgresql_using="hash")
+    op.create_unique_constraint("files_path_key", "files", ["path"])
+    op.drop_constraint("files_path_hash_key", "files", type_="unique")
+    op.drop_column("files", "path_hash")
@@ -0,0 +1,33 @@
+# pylint: disable=invalid-name
+"""Add index for latest recording lookups.
+
+Revision ID: 9a41c3d7e0b2
+Revises: e3bceeb7337f
+Create Date: 2026-10-15 11:02:37.190245
+
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str | None = "9a41c3d7e0b2"
+down_revision: str | None = "e3bceeb7337f"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    """Run the upgrade migrations."""
+    op.create_index(
+        "ix_recordings_camera_identifier_start_time",
+        "recordings",
+        ["camera_identifier", sa.text("start_time DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Run the downgrade migrations."""
+    op.drop_index("ix_recordings_camera_identifier_start_time", table_name="recordings")
@@ -0,0 +1,36 @@
+# pylint: disable=invalid-name
+"""Add indexes for fragment queries.
+
+Revision ID: c15f6a5c975d
+Revises: 31851b6eb50c
+Create Date: 2026-10-15 08:40:12.114021
+
+"""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str | None = "c15f6a5c975d"
+down_revision: str | None = "31851b6eb50c"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    """Run the upgrade migrations."""
+    op.create_index(
+        "ix_files_camera_identifier_category_subcategory",
+        "files",
+        ["camera_identifier", "category", "subcategory"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_files_meta_orig_ctime"), "files_meta", ["orig_ctime"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Run the downgrade migrations."""
+    op.drop_index(op.f("ix_files_meta_orig_ctime"), table_name="files_meta")
+    op.drop_index("ix_files_camera_identifier_category_subcategory", table_name="files")
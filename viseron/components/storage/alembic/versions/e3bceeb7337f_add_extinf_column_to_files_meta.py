@@ -0,0 +1,32 @@
+# pylint: disable=invalid-name
+"""Add extinf column to files_meta.
+
+Revision ID: e3bceeb7337f
+Revises: 28c8192bbcdb
+Create Date: 2026-10-15 10:12:44.518903
+
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str | None = "e3bceeb7337f"
+down_revision: str | None = "28c8192bbcdb"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    """Run the upgrade migrations."""
+    op.add_column("files_meta", sa.Column("extinf", sa.Float(), nullable=True))
+    op.execute(
+        "UPDATE files_meta SET extinf = (meta->'m3u8'->>'EXTINF')::float "
+        "WHERE meta->'m3u8'->>'EXTINF' IS NOT NULL"
+    )
+
+
+def downgrade() -> None:
+    """Run the downgrade migrations."""
+    op.drop_column("files_meta", "extinf")
@@ -2,12 +2,26 @@
 from __future__ import annotations
 
 import datetime
-from collections.abc import Callable
+import hashlib
+from collections.abc import Callable, Iterator
 from enum import Enum
 from typing import Literal
 
-from sqlalchemy import DateTime, Float, Integer, LargeBinary, String, types
+from sqlalchemy import (
+    DDL,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    LargeBinary,
+    Row,
+    String,
+    event,
+    text,
+    types,
+)
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.engine.default import DefaultExecutionContext
 from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
 from sqlalchemy.sql import expression
@@ -49,6 +63,11 @@ def pg_utcnow(
     return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
 
 
+def _path_hash(context: DefaultExecutionContext) -> bytes:
+    """Return the sha256 digest of the path being inserted."""
+    return hashlib.sha256(context.get_current_parameters()["path"].encode()).digest()
+
+
 class Base(DeclarativeBase):
     """Base class for database models."""
 
@@ -59,6 +78,17 @@ class Files(Base):
     """Database model for files."""
 
     __tablename__ = "files"
+    __table_args__ = (
+        Index(
+            "ix_files_camera_identifier_category_subcategory",
+            "camera_identifier",
+            "category",
+            "subcategory",
+        ),
+        # Equality lookups on path use a hash index, uniqueness is enforced on the
+        # much shorter path_hash
+        Index("ix_files_path", "path", postgresql_using="hash"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     tier_id: Mapped[int] = mapped_column(Integer)
@@ -66,7 +96,10 @@ class Files(Base):
     camera_identifier: Mapped[str] = mapped_column(String)
     category: Mapped[str] = mapped_column(String)
     subcategory: Mapped[str] = mapped_column(String)
-    path: Mapped[str] = mapped_column(String, unique=True)
+    path: Mapped[str] = mapped_column(String)
+    path_hash: Mapped[bytes] = mapped_column(
+        LargeBinary(32), unique=True, default=_path_hash
+    )
     directory: Mapped[str] = mapped_column(String)
     filename: Mapped[str] = mapped_column(String)
     size: Mapped[int] = mapped_column(Integer)
@@ -88,7 +121,8 @@ class FilesMeta(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     path: Mapped[str] = mapped_column(String, unique=True)
-    orig_ctime = mapped_column(UTCDateTime(timezone=False), nullable=False)
+    orig_ctime = mapped_column(UTCDateTime(timezone=False), nullable=False, index=True)
+    extinf: Mapped[float | None] = mapped_column(Float, nullable=True)
     meta: Mapped[ColumnMeta] = mapped_column(JSONB)
     created_at: Mapped[datetime.datetime] = mapped_column(
         UTCDateTime(timezone=False), server_default=UTCNow(), nullable=True
@@ -109,10 +143,20 @@ class Recordings(Base):
     """Database model for recordings."""
 
     __tablename__ = "recordings"
+    __table_args__ = (
+        Index(
+            "ix_recordings_camera_identifier_start_time",
+            "camera_identifier",
+            text("start_time DESC"),
+        ),
+        {"postgresql_partition_by": "RANGE (start_time)"},
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     camera_identifier: Mapped[str] = mapped_column(String)
-    start_time: Mapped[datetime.datetime] = mapped_column(UTCDateTime(timezone=False))
+    start_time: Mapped[datetime.datetime] = mapped_column(
+        UTCDateTime(timezone=False), primary_key=True
+    )
     end_time: Mapped[datetime.datetime | None] = mapped_column(
         UTCDateTime(timezone=False), nullable=True
     )
@@ -133,21 +177,39 @@ class Recordings(Base):
 
     def get_fragments(
         self, lookback: float, get_session: Callable[[], Session], now=None
-    ):
-        """Get all files for this recording.
+    ) -> Iterator[Row]:
+        """Yield all files for this recording.
 
         Local import to avoid circular imports.
         """
         # pylint: disable-next=import-outside-toplevel
         from viseron.components.storage.queries import get_recording_fragments
 
-        return get_recording_fragments(self.id, lookback, get_session, now)
+        return get_recording_fragments(
+            self.camera_identifier,
+            self.start_time,
+            self.end_time,
+            lookback,
+            get_session,
+            now,
+        )
 
 
 class Objects(Base):
     """Database model for objects."""
 
     __tablename__ = "objects"
+    __table_args__ = (
+        # Objects are inserted in created_at order, which makes a BRIN index a
+        # fraction of the size of a btree for time range scans
+        Index(
+            "ix_objects_created_at_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     camera_identifier: Mapped[str] = mapped_column(String)
@@ -162,7 +224,7 @@ class Objects(Base):
     snapshot_path: Mapped[str] = mapped_column(String, nullable=True)
     zone: Mapped[str | None] = mapped_column(String, nullable=True)
     created_at: Mapped[datetime.datetime] = mapped_column(
-        UTCDateTime(timezone=False), server_default=UTCNow(), nullable=True
+        UTCDateTime(timezone=False), server_default=UTCNow(), primary_key=True
     )
     updated_at: Mapped[datetime.datetime] = mapped_column(
         UTCDateTime(timezone=False), onupdate=UTCNow(), nullable=True
@@ -173,10 +235,13 @@ class Motion(Base):
     """Database model for motion."""
 
     __tablename__ = "motion"
+    __table_args__ = {"postgresql_partition_by": "RANGE (start_time)"}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     camera_identifier: Mapped[str] = mapped_column(String)
-    start_time: Mapped[datetime.datetime] = mapped_column(UTCDateTime(timezone=False))
+    start_time: Mapped[datetime.datetime] = mapped_column(
+        UTCDateTime(timezone=False), primary_key=True
+    )
     end_time: Mapped[datetime.datetime | None] = mapped_column(
         UTCDateTime(timezone=False), nullable=True
     )
@@ -237,3 +302,13 @@ class Events(Base):
     updated_at: Mapped[datetime.datetime] = mapped_column(
         UTCDateTime(timezone=False), onupdate=UTCNow(), nullable=True
     )
+
+
+# Partitioned tables need a DEFAULT partition to accept rows before the monthly
+# partitions have been created by the storage component
+CREATE_DEFAULT_PARTITION = DDL(
+    "CREATE TABLE %(table)s_default PARTITION OF %(table)s DEFAULT"
+)
+event.listen(Recordings.__table__, "after_create", CREATE_DEFAULT_PARTITION)
+event.listen(Objects.__table__, "after_create", CREATE_DEFAULT_PARTITION)
+event.listen(Motion.__table__, "after_create", CREATE_DEFAULT_PARTITION)
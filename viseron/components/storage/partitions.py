@@ -0,0 +1,176 @@
+"""Maintenance of partitioned tables.
+
+Time series tables are partitioned by month on their time column. Rows that do not
+fit in any of the monthly partitions are stored in the DEFAULT partition. Partitions
+that are emptied by the tier handlers are dropped again, since lookups that can not
+be pruned on the partition key have to probe every partition.
+"""
+from __future__ import annotations
+
+import datetime
+import logging
+import re
+from collections.abc import Callable
+
+from sqlalchemy import Table, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from viseron.components.storage.models import Base
+from viseron.helpers import utcnow
+
+LOGGER = logging.getLogger(__name__)
+
+RANGE_PARTITION_REGEX = re.compile(r"^RANGE \((?P<column>\w+)\)$")
+PARTITION_NAME_REGEX = re.compile(r"^(?P<table>\w+)_(default|\d{4}_\d{2})$")
+MONTHLY_PARTITION_NAME_REGEX = re.compile(
+    r"^(?P<table>\w+)_(?P<year>\d{4})_(?P<month>\d{2})$"
+)
+
+
+def get_range_partitioned_tables() -> list[Table]:
+    """Return all tables that are partitioned by range."""
+    return [
+        table
+        for table in Base.metadata.sorted_tables
+        if RANGE_PARTITION_REGEX.match(
+            table.dialect_options["postgresql"]["partition_by"] or ""
+        )
+    ]
+
+
+def is_partition(name: str) -> bool:
+    """Return True if name is a partition of one of the partitioned tables."""
+    if match := PARTITION_NAME_REGEX.match(name):
+        return match.group("table") in [
+            table.name for table in get_range_partitioned_tables()
+        ]
+    return False
+
+
+def month_start(timestamp: datetime.datetime) -> datetime.datetime:
+    """Return the start of the month as a naive UTC datetime."""
+    return timestamp.replace(
+        day=1, hour=0, minute=0, second=0, microsecond=0, tzinfo=None
+    )
+
+
+def next_month_start(timestamp: datetime.datetime) -> datetime.datetime:
+    """Return the start of the following month as a naive UTC datetime."""
+    return month_start(month_start(timestamp) + datetime.timedelta(days=32))
+
+
+def partition_name(table_name: str, timestamp: datetime.datetime) -> str:
+    """Return the name of the monthly partition holding timestamp."""
+    return f"{table_name}_{timestamp:%Y_%m}"
+
+
+def create_monthly_partition(
+    session: Session, table_name: str, timestamp: datetime.datetime
+) -> str:
+    """Create the monthly partition holding timestamp if it does not exist."""
+    name = partition_name(table_name, timestamp)
+    session.execute(
+        text(
+            f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table_name} "
+            f"FOR VALUES FROM ('{month_start(timestamp):%Y-%m-%d}') "
+            f"TO ('{next_month_start(timestamp):%Y-%m-%d}')"
+        )
+    )
+    return name
+
+
+def create_partitions(
+    get_session: Callable[[], Session], now: datetime.datetime | None = None
+) -> None:
+    """Create partitions for the current and the next month.
+
+    Creating a partition fails if the DEFAULT partition already holds rows within
+    its range. Those rows stay in the DEFAULT partition which is logged but is
+    otherwise harmless.
+    """
+    if now is None:
+        now = utcnow()
+
+    for table in get_range_partitioned_tables():
+        for timestamp in (now, next_month_start(now)):
+            try:
+                with get_session() as session:
+                    name = create_monthly_partition(session, table.name, timestamp)
+                    session.commit()
+            except SQLAlchemyError as error:
+                LOGGER.warning(
+                    f"Failed to create partition of {table.name} for "
+                    f"{timestamp:%Y-%m}: {error}"
+                )
+                continue
+            LOGGER.debug(f"Partition {name} is available")
+
+
+def get_monthly_partitions(
+    session: Session, table_name: str
+) -> list[tuple[datetime.datetime, str]]:
+    """Return the start and name of the monthly partitions, oldest first."""
+    names = session.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = :table_name"
+        ),
+        {"table_name": table_name},
+    ).scalars()
+
+    partitions = []
+    for name in names:
+        match = MONTHLY_PARTITION_NAME_REGEX.match(name)
+        if match and match.group("table") == table_name:
+            partitions.append(
+                (
+                    datetime.datetime(
+                        int(match.group("year")), int(match.group("month")), 1
+                    ),
+                    name,
+                )
+            )
+    return sorted(partitions)
+
+
+def drop_empty_partitions(
+    get_session: Callable[[], Session], now: datetime.datetime | None = None
+) -> None:
+    """Drop the empty monthly partitions older than the oldest remaining row.
+
+    Partitions are dropped oldest first until one that still holds rows is found.
+    The partition is detached before it is checked for rows, which locks out
+    concurrent inserts, so a row is never dropped together with its partition.
+    Partitions of the current month and later are always kept.
+    """
+    if now is None:
+        now = utcnow()
+    current_month = month_start(now)
+
+    for table in get_range_partitioned_tables():
+        with get_session() as session:
+            partitions = get_monthly_partitions(session, table.name)
+
+        for month, name in partitions:
+            if month >= current_month:
+                break
+
+            try:
+                with get_session() as session:
+                    session.execute(
+                        text(f"ALTER TABLE {table.name} DETACH PARTITION {name}")
+                    )
+                    if session.execute(
+                        text(f"SELECT EXISTS (SELECT 1 FROM {name})")
+                    ).scalar():
+                        session.rollback()
+                        break
+                    session.execute(text(f"DROP TABLE {name}"))
+                    session.commit()
+            except SQLAlchemyError as error:
+                LOGGER.warning(f"Failed to drop partition {name}: {error}")
+                break
+            LOGGER.debug(f"Dropped empty partition {name}")
@@ -3,15 +3,17 @@ from __future__ import annotations
 
 import datetime
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from functools import lru_cache
 
 from sqlalchemy import (
-    Float,
     Integer,
+    Row,
+    Select,
     String,
     TextualSelect,
     and_,
-    cast,
+    bindparam,
     column,
     desc,
     func,
@@ -19,15 +21,31 @@ from sqlalchemy import (
     select,
     text,
 )
-from sqlalchemy.dialects.postgresql import INTERVAL
 from sqlalchemy.orm import Session
-from sqlalchemy.sql.functions import coalesce, concat
+from sqlalchemy.sql.elements import BindParameter
 
-from viseron.components.storage.models import Files, FilesMeta, Recordings
+from viseron.components.storage.models import Files, FilesMeta
+from viseron.const import CAMERA_SEGMENT_DURATION
 from viseron.helpers import utcnow
 
 LOGGER = logging.getLogger(__name__)
 
+FRAGMENTS_YIELD_PER = 500
+# Upper bound of the duration of a single fragment, used to give the orig_ctime index
+# a lower bound when looking for the fragment that overlaps the start. Segments are
+# cut on keyframes so they can be longer than CAMERA_SEGMENT_DURATION
+FRAGMENT_MAX_DURATION = datetime.timedelta(seconds=CAMERA_SEGMENT_DURATION * 12)
+# Only the columns needed to build HLS fragments, to avoid hydrating ORM entities
+FRAGMENT_COLUMNS = (
+    Files.id,
+    Files.tier_id,
+    Files.path,
+    Files.filename,
+    Files.created_at,
+    FilesMeta.orig_ctime,
+    FilesMeta.extinf,
+)
+
 
 def files_to_move_query(
     category: str,
@@ -239,75 +257,102 @@ def recordings_to_move_query(
     )
 
 
-def get_recording_fragments(
-    recording_id,
-    lookback: float,
-    get_session: Callable[[], Session],
-    now=None,
-):
-    """Return a list of files for this recording.
-
-    We must sort on orig_ctime and not created_at as the created_at timestamp is
-    not accurate for m4s files that are created from the original mp4 file after
-    it has been recorded. The orig_ctime is the timestamp of the original mp4 file
-    and is therefore accurate.
-
-    Only the latest occurrence of each file is selected using the CTE row_number.
-    This is to accommodate for the case where a file has been copied to a succeeding
-    tier but has not been deleted from the original tier yet.
-    """
+# The fragment statement is built once and reused with different bind parameters
+# to avoid rebuilding the expression tree on every call.
+@lru_cache(maxsize=1)
+def _fragments_stmt() -> Select:
+    """Return the statement used to select the fragments of a time period."""
     row_number = (
         func.row_number()
         .over(partition_by=Files.filename, order_by=desc(Files.created_at))
         .label("row_number")
     )
-    recording_files = (
-        select(Files, FilesMeta)
-        .add_columns(row_number)
-        .join(Recordings, Files.camera_identifier == Recordings.camera_identifier)
+    start: BindParameter[datetime.datetime] = bindparam(
+        "start", type_=FilesMeta.orig_ctime.type
+    )
+    files = (
+        select(*FRAGMENT_COLUMNS, row_number)
         .join(FilesMeta, Files.path == FilesMeta.path)
-        .where(Recordings.id == recording_id)
+        .where(Files.camera_identifier.in_(bindparam("camera_identifiers")))
         .where(Files.category == "recorder")
-        .where(Files.path.endswith(".m4s"))
-        .where(FilesMeta.meta.comparator.has_key("m3u8"))  # type: ignore[attr-defined]
-        .where(
-            FilesMeta.meta["m3u8"].comparator.has_key(  # type: ignore[attr-defined]
-                "EXTINF"
-            ),
-        )
-        .where(FilesMeta.meta["m3u8"]["EXTINF"].astext.cast(Float) > 0)
+        .where(Files.subcategory == "segments")
+        .where(FilesMeta.extinf > 0)
         .where(
             or_(
-                # Fetch all files that start within the recording
+                # Fetch all files that start within the time period
                 FilesMeta.orig_ctime.between(
-                    Recordings.start_time - datetime.timedelta(seconds=lookback),
-                    coalesce(Recordings.end_time, now if now else utcnow()),
+                    start,
+                    bindparam("end", type_=FilesMeta.orig_ctime.type),
                 ),
-                # Fetch the first file that starts before the recording but
-                # ends during the recording
+                # Fetch the first file that starts before the time period but
+                # ends during the time period
                 and_(
-                    Recordings.start_time - datetime.timedelta(seconds=lookback)
-                    >= FilesMeta.orig_ctime,
-                    Recordings.start_time - datetime.timedelta(seconds=lookback)
+                    FilesMeta.orig_ctime >= start - FRAGMENT_MAX_DURATION,
+                    start >= FilesMeta.orig_ctime,
+                    start
                     <= FilesMeta.orig_ctime
-                    + cast(
-                        concat(FilesMeta.meta["m3u8"]["EXTINF"], " sec"),
-                        INTERVAL,
-                    ),
+                    + FilesMeta.extinf * datetime.timedelta(seconds=1),
                 ),
             )
         )
         .order_by(FilesMeta.orig_ctime.asc())
-        .cte("recording_files")
+        .cte("files")
     )
-    stmt = (
-        select(recording_files)
-        .where(recording_files.c.row_number == 1)
-        .order_by(recording_files.c.orig_ctime.asc())
+    return (
+        select(files).where(files.c.row_number == 1).order_by(files.c.orig_ctime.asc())
     )
+
+
+def _get_fragments(
+    camera_identifiers: list[str],
+    start: datetime.datetime,
+    end: datetime.datetime,
+    get_session: Callable[[], Session],
+) -> Iterator[Row]:
+    """Yield the files between start and end.
+
+    We must sort on orig_ctime and not created_at as the created_at timestamp is
+    not accurate for m4s files that are created from the original mp4 file after
+    it has been recorded. The orig_ctime is the timestamp of the original mp4 file
+    and is therefore accurate.
+
+    Only the latest occurrence of each file is selected using the CTE row_number.
+    This is to accommodate for the case where a file has been copied to a succeeding
+    tier but has not been deleted from the original tier yet.
+
+    Rows are fetched through a server side cursor in batches of FRAGMENTS_YIELD_PER,
+    and the session is kept open until the generator is exhausted or closed.
+    """
     with get_session() as session:
-        fragments = session.execute(stmt).all()
-    return fragments
+        yield from session.execute(
+            _fragments_stmt(),
+            {"camera_identifiers": camera_identifiers, "start": start, "end": end},
+            execution_options={"yield_per": FRAGMENTS_YIELD_PER},
+        )
+
+
+def get_recording_fragments(
+    camera_identifier: str,
+    start_time: datetime.datetime,
+    end_time: datetime.datetime | None,
+    lookback: float,
+    get_session: Callable[[], Session],
+    now=None,
+) -> Iterator[Row]:
+    """Yield the files for a recording.
+
+    The bounds of the recording are passed by the caller instead of joining the
+    recordings table on id, which can not be pruned since the table is partitioned
+    on start_time, and which hides the bounds from the orig_ctime index.
+    """
+    if end_time is None:
+        end_time = now if now else utcnow()
+    return _get_fragments(
+        [camera_identifier],
+        start_time - datetime.timedelta(seconds=lookback),
+        end_time,
+        get_session,
+    )
 
 
 def get_time_period_fragments(
@@ -316,59 +361,12 @@ def get_time_period_fragments(
     end_timestamp: int | float | None,
     get_session: Callable[[], Session],
     now=None,
-):
-    """Return a list of files for the requested time period."""
+) -> Iterator[Row]:
+    """Yield the files for the requested time period."""
     start = datetime.datetime.utcfromtimestamp(start_timestamp)
     if end_timestamp:
         end = datetime.datetime.utcfromtimestamp(end_timestamp)
     else:
         end = now if now else utcnow()
 
-    row_number = (
-        func.row_number()
-        .over(partition_by=Files.filename, order_by=desc(Files.created_at))
-        .label("row_number")
-    )
-    files = (
-        select(Files, FilesMeta)
-        .add_columns(row_number)
-        .join(FilesMeta, Files.path == FilesMeta.path)
-        .where(Files.camera_identifier.in_(camera_identifiers))
-        .where(Files.category == "recorder")
-        .where(Files.path.endswith(".m4s"))
-        .where(FilesMeta.meta.comparator.has_key("m3u8"))  # type: ignore[attr-defined]
-        .where(
-            FilesMeta.meta["m3u8"].comparator.has_key(  # type: ignore[attr-defined]
-                "EXTINF"
-            ),
-        )
-        .where(FilesMeta.meta["m3u8"]["EXTINF"].astext.cast(Float) > 0)
-        .where(
-            or_(
-                # Fetch all files that start within the recording
-                FilesMeta.orig_ctime.between(
-                    start,
-                    end,
-                ),
-                # Fetch the first file that starts before the recording but
-                # ends during the recording
-                and_(
-                    start >= FilesMeta.orig_ctime,
-                    start
-                    <= FilesMeta.orig_ctime
-                    + cast(
-                        concat(FilesMeta.meta["m3u8"]["EXTINF"], " sec"),
-                        INTERVAL,
-                    ),
-                ),
-            )
-        )
-        .order_by(FilesMeta.orig_ctime.asc())
-        .cte("files")
-    )
-    stmt = (
-        select(files).where(files.c.row_number == 1).order_by(files.c.orig_ctime.asc())
-    )
-    with get_session() as session:
-        fragments = session.execute(stmt).all()
-    return fragments
+    return _get_fragments(camera_identifiers, start, end, get_session)
@@ -841,7 +841,7 @@ def move_file(
             sel = select(FilesMeta).where(FilesMeta.path == src)
             res = session.execute(sel).scalar_one()
             ins = insert(FilesMeta).values(
-                path=dst, meta=res.meta, orig_ctime=res.orig_ctime
+                path=dst, meta=res.meta, orig_ctime=res.orig_ctime, extinf=res.extinf
             )
             session.execute(ins)
             session.commit()
@@ -878,6 +878,29 @@ def delete_file(
         logger.error(f"Failed to delete file {path}: {error}")
 
 
+def delete_files(
+    get_session: Callable[..., Session],
+    paths: list[str],
+    logger: logging.Logger,
+) -> None:
+    """Delete multiple files using a single database statement."""
+    if not paths:
+        return
+
+    logger.debug("Deleting files %s", paths)
+    with get_session() as session:
+        stmt = delete(Files).where(Files.path.in_(paths))
+        session.execute(stmt)
+        session.commit()
+
+    # The rows are already deleted, so a file that cannot be removed is only logged
+    for path in paths:
+        try:
+            os.remove(path)
+        except OSError as error:
+            logger.error(f"Failed to delete file {path}: {error}")
+
+
 def get_files_to_move(
     session: Session,
     category: str,
@@ -39,12 +39,17 @@ def delete_from_files_meta(
     _params,
     _execution_options,
 ) -> None:
-    """Delete a row from FilesMeta when a row is deleted from Files."""
+    """Delete rows from FilesMeta when rows are deleted from Files.
+
+    Handles both single path deletes and deletes of a list of paths using IN.
+    """
     if clauseelement.is_delete and clauseelement.table.name == Files.__tablename__:
         compiled = clauseelement.compile()
-        conn.execute(
-            delete(FilesMeta).where(FilesMeta.path == compiled.params["path_1"])
-        )
+        path = compiled.params["path_1"]
+        if isinstance(path, (list, tuple)):
+            conn.execute(delete(FilesMeta).where(FilesMeta.path.in_(path)))
+            return
+        conn.execute(delete(FilesMeta).where(FilesMeta.path == path))
 
 
 def setup_triggers(engine) -> None:
@@ -4,6 +4,7 @@ from __future__ import annotations
 import inspect
 import json
 import logging
+from dataclasses import dataclass
 from functools import partial
 from http import HTTPStatus
 from re import Pattern
@@ -48,15 +49,82 @@ class Route(TypedDict):
     request_arguments_schema: NotRequired[Schema]
 
 
+def _allow_token_parameter(schema: Schema, route: Route) -> Schema:
+    """Implicitly allow token parameter in schema if route allows it.
+
+    Extending a schema recompiles it, so this is done once when the handler class is
+    created instead of on every request.
+    """
+    if route.get("allow_token_parameter", False):
+        try:
+            schema = schema.extend({vol.Optional("token"): str})
+        except AssertionError:
+            LOGGER.warning(
+                "Schema is not a dict, cannot extend with token parameter "
+                "for route %s",
+                route["path_pattern"],
+            )
+    return schema
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledRoute:
+    """Route with its path pattern and schemas compiled for dispatch."""
+
+    route: Route
+    path_match: tornado.routing.PathMatches
+    supported_methods: frozenset[str]
+    method: str
+    requires_auth: bool
+    requires_camera_token: bool
+    requires_group: frozenset[Group] | None
+    allow_token_parameter: bool
+    json_body_schema: Schema | None
+    request_arguments_schema: Schema | None
+
+    @classmethod
+    def from_route(cls, route: Route) -> CompiledRoute:
+        """Compile a route."""
+        schema = route.get("request_arguments_schema", None)
+        return cls(
+            route=route,
+            path_match=tornado.routing.PathMatches(
+                f"{API_BASE}{route['path_pattern']}"
+            ),
+            supported_methods=frozenset(route["supported_methods"]),
+            method=route["method"],
+            requires_auth=route.get("requires_auth", True),
+            requires_camera_token=route.get("requires_camera_token", False),
+            requires_group=(
+                frozenset(requires_group)
+                if (requires_group := route.get("requires_group", None))
+                else None
+            ),
+            allow_token_parameter=route.get("allow_token_parameter", False),
+            json_body_schema=route.get("json_body_schema", None),
+            request_arguments_schema=(
+                _allow_token_parameter(schema, route) if schema else None
+            ),
+        )
+
+
 class BaseAPIHandler(ViseronRequestHandler):
     """Base handler for all API endpoints."""
 
     routes: list[Route] = []
+    _compiled_routes: tuple[CompiledRoute, ...] = ()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Compile the path patterns and schemas of the routes once per class."""
+        super().__init_subclass__(**kwargs)
+        cls._compiled_routes = tuple(
+            CompiledRoute.from_route(route) for route in cls.routes
+        )
 
     def initialize(self, vis: Viseron) -> None:
         """Initialize."""
         super().initialize(vis)
-        self.route: Route = {}  # type: ignore[typeddict-item]
+        self.route: CompiledRoute | None = None
         self.request_arguments: dict[str, Any] = {}
         self.json_body = {}
         self.browser_request = False
@@ -106,10 +174,10 @@ class BaseAPIHandler(ViseronRequestHandler):
         )
 
     def validate_json_body(
-        self, route: Route
+        self, route: CompiledRoute
     ) -> tuple[Literal[False], str] | tuple[Literal[True], None]:
         """Validate JSON body."""
-        if schema := route.get("json_body_schema", None):
+        if schema := route.json_body_schema:
             try:
                 json_body = json.loads(self.request.body)
             except json.JSONDecodeError:
@@ -159,7 +227,11 @@ class BaseAPIHandler(ViseronRequestHandler):
             self.browser_request = True
             auth_header = self._construct_jwt_from_header_and_cookies()
         # Route allows JWT Header + Payload in URL parameter
-        if auth_header is None and self.route.get("allow_token_parameter", False):
+        if (
+            auth_header is None
+            and self.route is not None
+            and self.route.allow_token_parameter
+        ):
             auth_header = self._construct_jwt_from_parameter_and_cookies()
         # Header could not be constructed from cookies or URL parameter
         if auth_header is None:
@@ -183,34 +255,18 @@ class BaseAPIHandler(ViseronRequestHandler):
             auth_val, check_refresh_token=self.browser_request
         )
 
-    def _allow_token_parameter(self, schema: Schema, route: Route) -> Schema:
-        """Allow token parameter in schema."""
-        if route.get("allow_token_parameter", False):
-            try:
-                schema = schema.extend({vol.Optional("token"): str})
-            except AssertionError:
-                LOGGER.warning(
-                    "Schema is not a dict, cannot extend with token parameter "
-                    "for route %s",
-                    self.request.uri,
-                )
-        return schema
-
     async def route_request(self) -> None:
         """Route request to correct API endpoint."""
         unsupported_method = False
 
-        for route in self.routes:
-            path_match = tornado.routing.PathMatches(
-                f"{API_BASE}{route['path_pattern']}"
-            )
-            if path_match.regex.match(self.request.path):
-                if self.request.method not in route["supported_methods"]:
+        for route in self._compiled_routes:
+            if route.path_match.regex.match(self.request.path):
+                if self.request.method not in route.supported_methods:
                     unsupported_method = True
                     continue
 
                 self.route = route
-                if self._webserver.auth and route.get("requires_auth", True):
+                if self._webserver.auth and route.requires_auth:
                     if not await self.run_in_executor(self.validate_auth_header):
                         self.response_error(
                             HTTPStatus.UNAUTHORIZED, reason="Authentication required"
@@ -223,11 +279,11 @@ class BaseAPIHandler(ViseronRequestHandler):
                         )
                         return
 
-                    if requires_group := route.get("requires_group", None):
+                    if requires_group := route.requires_group:
                         if self.current_user.group not in requires_group:
                             LOGGER.debug(
                                 "Request with invalid permissions, endpoint requires"
-                                f" {requires_group}, user is in group"
+                                f" {list(requires_group)}, user is in group"
                                 f" {self.current_user.group}"
                             )
                             self.response_error(
@@ -249,17 +305,15 @@ class BaseAPIHandler(ViseronRequestHandler):
                             )
                             return
 
-                params = path_match.match(self.request)
+                params = route.path_match.match(self.request)
                 if params is None:
                     params = {}
 
                 request_arguments = {
                     k: self.get_argument(k) for k in self.request.arguments
                 }
-                if schema := route.get("request_arguments_schema", None):
+                if schema := route.request_arguments_schema:
                     try:
-                        # Implicitly allow token parameter if route allows it
-                        schema = self._allow_token_parameter(schema, route)
                         self.request_arguments = schema(request_arguments)
                     except vol.Invalid as err:
                         LOGGER.error(
@@ -280,7 +334,7 @@ class BaseAPIHandler(ViseronRequestHandler):
                 for key, value in path_kwargs.items():
                     path_kwargs[key] = value.decode()
 
-                if self._webserver.auth and route.get("requires_camera_token", False):
+                if self._webserver.auth and route.requires_camera_token:
                     camera_identifier = path_kwargs.get("camera_identifier", None)
                     if not camera_identifier:
                         self.response_error(
@@ -323,21 +377,21 @@ class BaseAPIHandler(ViseronRequestHandler):
                         "Routing to {}.{}(*args={}, **kwargs={}, request_arguments={})"
                     ).format(
                         self.__class__.__name__,
-                        route["method"],
+                        route.method,
                         path_args,
                         path_kwargs,
                         self.request_arguments,
                     ),
                 )
                 try:
-                    func = getattr(self, route["method"])
+                    func = getattr(self, route.method)
                     if inspect.iscoroutinefunction(func):
                         return await func(*path_args, **path_kwargs)
                     return func(*path_args, **path_kwargs)
                 except Exception as error:  # pylint: disable=broad-except
                     LOGGER.error(
                         f"Error in API {self.__class__.__name__}."
-                        f"{self.route['method']}: "
+                        f"{route.method}: "
                         f"{str(error)}",
                         exc_info=True,
                     )
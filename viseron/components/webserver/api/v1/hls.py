@@ -248,16 +248,8 @@ def _generate_playlist(
         now=now,
     )
     fragments = [
-        Fragment(
-            file.filename,
-            f"/files{file.path}",
-            float(
-                file.meta["m3u8"]["EXTINF"],
-            ),
-            file.orig_ctime,
-        )
+        Fragment(file.filename, f"/files{file.path}", file.extinf, file.orig_ctime)
         for file in files
-        if file.meta.get("m3u8", {}).get("EXTINF", False)
     ]
 
     end: bool = True
@@ -272,9 +264,11 @@ def _generate_playlist(
         LOGGER.debug("Recording ended more than a minute ago")
         end = True
     # Recording has ended but the last file is not finished yet
-    elif len(files) > 0 and recording.end_time.timestamp() > float(
-        files[-1].filename.split(".")[0]
-    ) + float(files[-1].meta["m3u8"]["EXTINF"]):
+    elif (
+        fragments
+        and recording.end_time.timestamp()
+        > float(fragments[-1].filename.split(".")[0]) + fragments[-1].duration
+    ):
         LOGGER.debug("Recording has ended but the last file is not finished yet")
         end = False
 
@@ -326,15 +320,9 @@ def _generate_playlist_time_period(
     end_playlist = bool(end_timestamp) if not end_playlist_at_timestamp else False
 
     for file in files:
-        if file.meta.get("m3u8", {}).get("EXTINF", False):
-            fragments.append(
-                Fragment(
-                    file.filename,
-                    f"/files{file.path}",
-                    float(file.meta["m3u8"]["EXTINF"]),
-                    file.orig_ctime,
-                )
-            )
+        fragments.append(
+            Fragment(file.filename, f"/files{file.path}", file.extinf, file.orig_ctime)
+        )
 
     media_sequence = (
         update_hls_client(hls_client_id, fragments)
@@ -8,6 +8,7 @@ from typing import cast
 import voluptuous as vol
 
 from viseron.components.webserver.api.handlers import BaseAPIHandler
+from viseron.domains.camera.recorder import get_recordings_multiple_cameras
 from viseron.helpers.validators import request_argument_bool, request_argument_no_value
 
 LOGGER = logging.getLogger(__name__)
@@ -144,25 +145,15 @@ class RecordingsAPIHandler(BaseAPIHandler):
             )
             return
 
-        recordings = {}
-        for camera in cameras.values():
-            if self.request_arguments["latest"] and self.request_arguments.get(
-                "daily", False
-            ):
-                recordings[camera.identifier] = await self.run_in_executor(
-                    camera.recorder.get_latest_recording_daily
-                )
-                continue
-            if self.request_arguments["latest"]:
-                recordings[camera.identifier] = await self.run_in_executor(
-                    camera.recorder.get_latest_recording
-                )
-                continue
-            recordings[camera.identifier] = await self.run_in_executor(
-                camera.recorder.get_recordings
+        self.response_success(
+            response=await self.run_in_executor(
+                get_recordings_multiple_cameras,
+                self._get_session,
+                [camera.identifier for camera in cameras.values()],
+                self.request_arguments["latest"],
+                self.request_arguments.get("daily", False),
             )
-
-        self.response_success(response=recordings)
+        )
         return
 
     async def get_recordings_camera(
@@ -9,6 +9,8 @@ UPDATE_TOKEN_INTERVAL_MINUTES: Final = 5
 
 VIDEO_CONTAINER = "mp4"
 
+LATEST_RECORDING_CACHE_SIZE: Final = 32
+
 # Event topic constants
 EVENT_STATUS = "{camera_identifier}/camera/status"
 EVENT_STATUS_DISCONNECTED = "disconnected"
@@ -12,11 +12,11 @@ import uuid
 from collections.abc import Callable
 from dataclasses import dataclass
 from math import ceil
-from typing import TYPE_CHECKING, Literal, TypedDict
+from typing import TYPE_CHECKING, Any, Literal, TypedDict
 
 import psutil
 from path import Path
-from sqlalchemy import insert
+from sqlalchemy.dialects.postgresql import insert
 
 from viseron.components.storage.const import COMPONENT as STORAGE_COMPONENT
 from viseron.components.storage.models import FilesMeta
@@ -202,29 +202,41 @@ class Fragmenter:
         except FileNotFoundError:
             self._logger.debug(f"{file} not found", exc_info=True)
 
-    def _write_files_metadata(
+    def _files_metadata(
         self,
         file: str,
         extinf: float,
         program_date_time: datetime.datetime | None = None,
-    ):
-        """Write metadata about the fragmented mp4 to the database."""
-        with self._storage.get_session() as session:
-            if program_date_time:
-                orig_ctime = program_date_time
-            else:
-                orig_ctime = datetime.datetime.fromtimestamp(
-                    int(file.split(".")[0]), tz=None
-                ) - datetime.timedelta(seconds=time.localtime().tm_gmtoff)
+    ) -> dict[str, Any]:
+        """Return metadata about the fragmented mp4 to write to the database."""
+        if program_date_time:
+            orig_ctime = program_date_time
+        else:
+            orig_ctime = datetime.datetime.fromtimestamp(
+                int(file.split(".")[0]), tz=None
+            ) - datetime.timedelta(seconds=time.localtime().tm_gmtoff)
 
-            stmt = insert(FilesMeta).values(
-                path=os.path.join(
-                    self._camera.segments_folder, file.split(".")[0] + ".m4s"
-                ),
-                orig_ctime=orig_ctime,
-                meta={"m3u8": {"EXTINF": extinf}},
+        return {
+            "path": os.path.join(
+                self._camera.segments_folder, file.split(".")[0] + ".m4s"
+            ),
+            "orig_ctime": orig_ctime,
+            "extinf": extinf,
+            "meta": {"m3u8": {"EXTINF": extinf}},
+        }
+
+    def _write_files_metadata(self, files_metadata: list[dict[str, Any]]) -> None:
+        """Write metadata about the fragmented mp4s to the database.
+
+        All rows are written in a single executemany to avoid one round trip per file.
+        Rows that already exist are skipped, so that files whose metadata was written
+        but that failed to move in a previous iteration can be processed again.
+        """
+        with self._storage.get_session() as session:
+            session.execute(
+                insert(FilesMeta).on_conflict_do_nothing(index_elements=["path"]),
+                files_metadata,
             )
-            session.execute(stmt)
             session.commit()
 
     def _read_m3u8_mp4box(self, file: str) -> str:
@@ -248,48 +260,86 @@ class Fragmenter:
             encoding="utf-8",
         ).read()
 
-    def _handle_mp4(self, file: str):
-        """Handle mp4 files."""
+    def _cleanup_mp4(self, file: str) -> None:
+        """Remove the temporary files of a mp4 file handled by MP4Box."""
+        try:
+            os.remove(os.path.join(self._camera.temp_segments_folder, file))
+            shutil.rmtree(
+                os.path.join(self._camera.temp_segments_folder, file.split(".")[0]),
+            )
+        except FileNotFoundError as err:
+            self._logger.error("Failed to delete broken fragment", exc_info=err)
+
+    def _cleanup_m4s(self, file: str) -> None:
+        """Remove the temporary m4s file if it has not been moved."""
+        try:
+            os.remove(os.path.join(self._camera.temp_segments_folder, file))
+        except FileNotFoundError:
+            pass
+
+    def _handle_mp4(self, file: str) -> dict[str, Any] | None:
+        """Handle mp4 files.
+
+        Returns the metadata to write to the database, or None if fragmentation
+        failed, in which case the temporary files are removed.
+        """
         try:
             if self._mp4box_command(file):
                 extinf = _extract_extinf_number(
                     self._read_m3u8_mp4box(file), "clip_1.m4s"
                 )
                 if extinf:
-                    self._write_files_metadata(file, extinf)
-                    self._move_to_segments_folder_mp4box(file)
-                else:
-                    self._logger.error(f"Failed to get extinf for {file}")
+                    return self._files_metadata(file, extinf)
+                self._logger.error(f"Failed to get extinf for {file}")
         except Exception as err:  # pylint: disable=broad-except
             self._logger.error(f"Failed to fragment {file}", exc_info=err)
 
-        try:
-            os.remove(os.path.join(self._camera.temp_segments_folder, file))
-            shutil.rmtree(
-                os.path.join(self._camera.temp_segments_folder, file.split(".")[0]),
-            )
-        except FileNotFoundError as err:
-            self._logger.error("Failed to delete broken fragment", exc_info=err)
+        self._cleanup_mp4(file)
+        return None
 
-    def _handle_m4s(self, file: str):
-        """Handle m4s (fragmented mp4) files."""
+    def _handle_m4s(self, file: str) -> dict[str, Any] | None:
+        """Handle m4s (fragmented mp4) files.
+
+        Returns the metadata to write to the database, or None if the file could not
+        be processed, in which case the temporary file is removed.
+        """
         try:
             m3u8 = self._read_m3u8()
             extinf = _extract_extinf_number(m3u8, file)
             program_date_time = _extract_program_date_time(m3u8, file)
             if extinf:
-                self._write_files_metadata(file, extinf, program_date_time)
-                self._move_to_segments_folder(file)
-            else:
-                self._logger.error(f"Failed to get extinf for {file}")
-                os.remove(os.path.join(self._camera.temp_segments_folder, file))
+                return self._files_metadata(file, extinf, program_date_time)
+            self._logger.error(f"Failed to get extinf for {file}")
         except Exception as err:  # pylint: disable=broad-except
             self._logger.error(f"Failed to process m4s file {file}", exc_info=err)
-        finally:
+
+        self._cleanup_m4s(file)
+        return None
+
+    def _cleanup_fragment(self, file: str) -> None:
+        """Remove the temporary files of a handled file."""
+        if file.split(".")[1] == "m4s":
+            self._cleanup_m4s(file)
+        else:
+            self._cleanup_mp4(file)
+
+    def _move_fragments(self, files: list[str]) -> None:
+        """Move the handled files to the segments folder and clean up."""
+        for file in files:
+            try:
+                if file.split(".")[1] == "m4s":
+                    self._move_to_segments_folder(file)
+                else:
+                    self._move_to_segments_folder_mp4box(file)
+            except Exception as err:  # pylint: disable=broad-except
+                self._logger.error(
+                    f"Failed to move {file} to segments folder", exc_info=err
+                )
+
             try:
-                os.remove(os.path.join(self._camera.temp_segments_folder, file))
-            except FileNotFoundError:
-                pass
+                self._cleanup_fragment(file)
+            except OSError as err:
+                self._logger.error(f"Failed to clean up {file}", exc_info=err)
 
     def _create_fragmented_mp4(self):
         """Create fragmented mp4 from mp4 using MP4Box."""
@@ -299,12 +349,34 @@ class Fragmenter:
         )
         mp4s = _get_mp4_files_to_fragment(self._camera.temp_segments_folder)
         # Handle max 5 files per iteration to avoid blocking the thread for too long
+        handled_files: list[str] = []
+        files_metadata: list[dict[str, Any]] = []
         for mp4 in sorted(mp4s)[:5]:
             self._logger.debug(f"Processing {mp4}")
             if mp4.split(".")[1] == "m4s":
-                self._handle_m4s(mp4)
+                metadata = self._handle_m4s(mp4)
             else:
-                self._handle_mp4(mp4)
+                metadata = self._handle_mp4(mp4)
+            if metadata:
+                handled_files.append(mp4)
+                files_metadata.append(metadata)
+
+        if not handled_files:
+            return
+
+        # The metadata has to be written before the files are moved, since the
+        # tier handler picks up the files as soon as they appear in the segments folder
+        try:
+            self._write_files_metadata(files_metadata)
+        except Exception as err:  # pylint: disable=broad-except
+            self._logger.error(
+                f"Failed to write metadata for {handled_files}", exc_info=err
+            )
+            for file in handled_files:
+                self._cleanup_fragment(file)
+            return
+
+        self._move_fragments(handled_files)
 
     def _shutdown(self) -> None:
         """Handle shutdown event."""
@@ -458,35 +530,26 @@ def get_available_timespans(
     files = get_time_period_fragments(
         camera_identifiers, time_from, time_to, get_session
     )
-    fragments = [
-        Fragment(
-            file.filename,
-            f"/files{file.path}",
-            float(
-                file.meta["m3u8"]["EXTINF"],
-            ),
-            file.orig_ctime,
-        )
-        for file in files
-        if file.meta.get("m3u8", {}).get("EXTINF", False)
-    ]
 
     timespans: list[Timespan] = []
     start = None
     end = None
-    for fragment in fragments:
+    for file in files:
+        # Convert to a timestamp once per fragment since it is used multiple times
+        creation_timestamp = file.orig_ctime.timestamp()
+        duration = file.extinf
         if start is None:
-            start = fragment.creation_time.timestamp()
+            start = creation_timestamp
         if end is None:
-            end = fragment.creation_time.timestamp() + fragment.duration
-        if fragment.creation_time.timestamp() > end + fragment.duration:
+            end = creation_timestamp + duration
+        if creation_timestamp > end + duration:
             timespans.append(
                 {"start": int(start), "end": int(end), "duration": int(end - start)}
             )
             start = None
             end = None
         else:
-            end = fragment.creation_time.timestamp() + fragment.duration
+            end = creation_timestamp + duration
     if start is not None and end is not None:
         timespans.append(
             {"start": int(start), "end": int(end), "duration": int(end - start)}
@@ -6,14 +6,15 @@ import logging
 import os
 import shutil
 import threading
+import time
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterator, Sequence
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, TypedDict
 
 import cv2
 import numpy as np
-from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy import Row, and_, delete, func, insert, select, update
 from sqlalchemy.orm import Session
 
 from viseron.components.storage.const import COMPONENT as STORAGE_COMPONENT
@@ -24,6 +25,7 @@ from viseron.domains.camera.fragmenter import Fragment
 from viseron.domains.object_detector.detected_object import DetectedObject
 from viseron.events import EventData
 from viseron.helpers import create_directory, draw_objects, utcnow
+from viseron.helpers.fixed_size_dict import FixedSizeDict
 
 from .const import (
     CONFIG_CREATE_EVENT_CLIP,
@@ -38,6 +40,7 @@ from .const import (
     EVENT_RECORDER_COMPLETE,
     EVENT_RECORDER_START,
     EVENT_RECORDER_STOP,
+    LATEST_RECORDING_CACHE_SIZE,
 )
 from .entity.binary_sensor import RecorderBinarySensor
 from .entity.image import ThumbnailImage
@@ -113,10 +116,21 @@ class Recording:
         }
 
     def get_fragments(
-        self, lookback: float, get_session: Callable[[], Session], now=None
-    ):
-        """Return a list of files for this recording."""
-        return get_recording_fragments(self.id, lookback, get_session, now)
+        self,
+        camera_identifier: str,
+        lookback: float,
+        get_session: Callable[[], Session],
+        now=None,
+    ) -> Iterator[Row]:
+        """Yield the files for this recording."""
+        return get_recording_fragments(
+            camera_identifier,
+            self.start_time,
+            self.end_time,
+            lookback,
+            get_session,
+            now,
+        )
 
 
 class RecorderBase:
@@ -135,36 +149,94 @@ class RecorderBase:
 
         self._storage: Storage = vis.data[STORAGE_COMPONENT]
 
+        self._latest_recording_cache: FixedSizeDict[
+            tuple[str | None, bool],
+            tuple[float, dict[str, dict[int, RecordingDict]]],
+        ] = FixedSizeDict(maxlen=LATEST_RECORDING_CACHE_SIZE)
+        self._latest_recording_cache_lock = threading.Lock()
+        self._latest_recording_cache_version = 0
+
     def get_recordings(self, date=None) -> dict[str, dict[int, RecordingDict]]:
         """Return all recordings."""
         return get_recordings(self._storage.get_session, self._camera.identifier, date)
 
+    def _get_latest_recording_cached(
+        self, date: str | None, daily: bool
+    ) -> dict[str, dict[int, RecordingDict]]:
+        """Return the latest recording(s), cached for a short period of time.
+
+        The latest recordings are polled frequently by the frontend, so the result
+        is cached for the duration of one segment. The cache is invalidated
+        whenever a recording is started, stopped or deleted. A result is only cached
+        if the cache was not invalidated while it was being queried.
+        """
+        key = (date, daily)
+        now = time.monotonic()
+        with self._latest_recording_cache_lock:
+            cached = self._latest_recording_cache.get(key)
+            version = self._latest_recording_cache_version
+        if cached and cached[0] > now:
+            return cached[1]
+
+        recordings = get_recordings(
+            self._storage.get_session,
+            self._camera.identifier,
+            date,
+            latest=True,
+            daily=daily,
+        )
+        with self._latest_recording_cache_lock:
+            if version == self._latest_recording_cache_version:
+                self._latest_recording_cache[key] = (
+                    now + CAMERA_SEGMENT_DURATION,
+                    recordings,
+                )
+        return recordings
+
+    def invalidate_latest_recording_cache(self) -> None:
+        """Invalidate the cached latest recordings."""
+        with self._latest_recording_cache_lock:
+            self._latest_recording_cache_version += 1
+            self._latest_recording_cache.clear()
+
     def get_latest_recording(self, date=None) -> dict[str, dict[int, RecordingDict]]:
         """Return the latest recording."""
-        return get_recordings(
-            self._storage.get_session, self._camera.identifier, date, latest=True
-        )
+        return self._get_latest_recording_cached(date, False)
 
     def get_latest_recording_daily(self) -> dict[str, dict[int, RecordingDict]]:
         """Return the latest recording for each day."""
-        return get_recordings(
-            self._storage.get_session, self._camera.identifier, latest=True, daily=True
-        )
+        return self._get_latest_recording_cached(None, True)
 
     def delete_recording(self, date=None, recording_id=None) -> bool:
         """Delete a single recording.
 
         We dont have to delete the segments as they will be deleted by the tier
-        handler the next time it runs.
+        handler the next time it runs. Thumbnails and event clips are not cleaned up
+        by the tier handler, so they are deleted here using a single statement.
+
+        Local import to avoid circular imports.
         """
-        return bool(
-            delete_recordings(
-                self._storage.get_session,
-                self._camera.identifier,
-                date=date,
-                recording_id=recording_id,
-            )
+        # pylint: disable-next=import-outside-toplevel
+        from viseron.components.storage.tier_handler import delete_files
+
+        deleted = delete_recordings(
+            self._storage.get_session,
+            self._camera.identifier,
+            date=date,
+            recording_id=recording_id,
         )
+        self.invalidate_latest_recording_cache()
+        delete_files(
+            self._storage.get_session,
+            [
+                path
+                for recording in deleted
+                for path in (recording.thumbnail_path, recording.clip_path)
+                if path
+            ],
+            self._logger,
+        )
+        return bool(deleted)
 
     @property
     @abstractmethod
@@ -272,9 +344,11 @@ class AbstractRecorder(ABC, RecorderBase):
                     thumbnail_path=thumbnail_path,
                 )
                 .where(Recordings.id == recording_id)
+                .where(Recordings.start_time == start_time)
             )
             session.execute(stmt2)
             session.commit()
+        self.invalidate_latest_recording_cache()
 
         recording = Recording(
             id=recording_id,
@@ -327,12 +401,14 @@ class AbstractRecorder(ABC, RecorderBase):
             stmt = (
                 update(Recordings)
                 .where(Recordings.id == recording.id)
+                .where(Recordings.start_time == recording.start_time)
                 .values(
                     end_time=recording.end_time,
                 )
             )
             session.execute(stmt)
             session.commit()
+        self.invalidate_latest_recording_cache()
 
         self._stop(recording)
         self._active_recording = None
@@ -353,15 +429,13 @@ class AbstractRecorder(ABC, RecorderBase):
 
     def _concatenate_fragments(self, recording: Recording) -> None:
         files = recording.get_fragments(
+            self._camera.identifier,
             self.lookback,
             self._storage.get_session,
         )
         fragments = [
-            Fragment(
-                file.filename, file.path, file.meta["m3u8"]["EXTINF"], file.orig_ctime
-            )
+            Fragment(file.filename, file.path, file.extinf, file.orig_ctime)
             for file in files
-            if file.meta.get("m3u8", False).get("EXTINF", False)
         ]
         event_clip = self._camera.fragmenter.concatenate_fragments(fragments)
         if not event_clip:
@@ -377,6 +451,7 @@ class AbstractRecorder(ABC, RecorderBase):
             stmt = (
                 update(Recordings)
                 .where(Recordings.id == recording.id)
+                .where(Recordings.start_time == recording.start_time)
                 .values(
                     clip_path=recording.path,
                 )
@@ -440,6 +515,20 @@ class FailedCameraRecorder(RecorderBase):
         )
 
 
+def _recordings_date_filter(date: str):
+    """Return a filter for recordings started at date.
+
+    Compares start_time to a range instead of using DATE(start_time) since the
+    recordings table is partitioned on start_time, which allows Postgres to skip
+    the partitions outside the range.
+    """
+    start = datetime.datetime.strptime(date, "%Y-%m-%d")
+    return and_(
+        Recordings.start_time >= start,
+        Recordings.start_time < start + datetime.timedelta(days=1),
+    )
+
+
 def get_recordings(
     get_session: Callable[[], Session],
     camera_identifier,
@@ -455,18 +544,60 @@ def get_recordings(
         .order_by(func.DATE(Recordings.start_time).desc(), Recordings.start_time.desc())
     )
     if date:
-        stmt = stmt.where(func.DATE(Recordings.start_time) == date)
+        stmt = stmt.where(_recordings_date_filter(date))
     if latest and daily:
         stmt = stmt.distinct(func.DATE(Recordings.start_time))
     elif latest:
         stmt = stmt.limit(1)
     with get_session() as session:
         for recording in session.execute(stmt).scalars():
-            if recording.start_time.date().isoformat() not in recordings:
-                recordings[recording.start_time.date().isoformat()] = {}
-            recordings[recording.start_time.date().isoformat()][
+            recording_date = recording.start_time.date().isoformat()
+            recordings.setdefault(recording_date, {})[
                 recording.id
-            ] = _recording_file_dict(recording)
+            ] = _recording_file_dict(recording, recording_date)
+
+    return recordings
+
+
+def get_recordings_multiple_cameras(
+    get_session: Callable[[], Session],
+    camera_identifiers: list[str],
+    latest=False,
+    daily=False,
+) -> dict[str, dict[str, dict[int, RecordingDict]]]:
+    """Return all recordings for multiple cameras using a single query.
+
+    If latest is set, DISTINCT ON is used to only return the latest recording of each
+    camera, or the latest recording of each day and camera if daily is also set.
+    """
+    recordings: dict[str, dict[str, dict[int, RecordingDict]]] = {
+        camera_identifier: {} for camera_identifier in camera_identifiers
+    }
+    stmt = select(Recordings).where(
+        Recordings.camera_identifier.in_(camera_identifiers)
+    )
+    if latest and daily:
+        stmt = stmt.distinct(
+            Recordings.camera_identifier, func.DATE(Recordings.start_time)
+        ).order_by(
+            Recordings.camera_identifier,
+            func.DATE(Recordings.start_time).desc(),
+            Recordings.start_time.desc(),
+        )
+    elif latest:
+        stmt = stmt.distinct(Recordings.camera_identifier).order_by(
+            Recordings.camera_identifier, Recordings.start_time.desc()
+        )
+    else:
+        stmt = stmt.order_by(
+            func.DATE(Recordings.start_time).desc(), Recordings.start_time.desc()
+        )
+    with get_session() as session:
+        for recording in session.execute(stmt).scalars():
+            recording_date = recording.start_time.date().isoformat()
+            recordings[recording.camera_identifier].setdefault(recording_date, {})[
+                recording.id
+            ] = _recording_file_dict(recording, recording_date)
 
     return recordings
 
@@ -479,7 +610,8 @@ def delete_recordings(
 ) -> Sequence[Recordings]:
     """Delete recordings from the database.
 
-    Returns the deleted recordings so that they can be deleted from disk.
+    Returns the deleted recordings so that they can be deleted from disk, ordered by
+    id since RETURNING does not guarantee any order.
     """
     stmt = (
         delete(Recordings)
@@ -487,17 +619,22 @@ def delete_recordings(
         .returning(Recordings)
     )
     if date:
-        stmt = stmt.where(func.DATE(Recordings.start_time) == date)
+        stmt = stmt.where(_recordings_date_filter(date))
     if recording_id:
         stmt = stmt.where(Recordings.id == recording_id)
     with get_session() as session:
         _deleted_recordings = session.execute(stmt).scalars().all()
         session.commit()
-    return _deleted_recordings
+    return sorted(_deleted_recordings, key=lambda recording: recording.id)
 
 
-def _recording_file_dict(recording: Recordings) -> RecordingDict:
-    """Return a dict with recording file information."""
+def _recording_file_dict(
+    recording: Recordings, date: str | None = None
+) -> RecordingDict:
+    """Return a dict with recording file information.
+
+    date can be passed if it has already been computed by the caller.
+    """
     return {
         "id": recording.id,
         "camera_identifier": recording.camera_identifier,
@@ -505,7 +642,7 @@ def _recording_file_dict(recording: Recordings) -> RecordingDict:
         "start_timestamp": recording.start_time.timestamp(),
         "end_time": recording.end_time,
         "end_timestamp": recording.end_time.timestamp() if recording.end_time else None,
-        "date": recording.start_time.date().isoformat(),
+        "date": date if date else recording.start_time.date().isoformat(),
         "trigger_type": recording.trigger_type,
         "trigger_id": recording.trigger_id,
         "thumbnail_path": f"/files{recording.thumbnail_path}",
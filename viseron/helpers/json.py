@@ -6,6 +6,7 @@ from enum import Enum
 from typing import Any
 
 import numpy as np
+import orjson
 
 
 class JSONEncoder(json.JSONEncoder):
@@ -27,3 +28,14 @@ class JSONEncoder(json.JSONEncoder):
             return o.tolist()
 
         return json.JSONEncoder.default(self, o)
+
+
+def orjson_dumps(obj: Any) -> str:
+    """Serialize obj to a JSON string using orjson.
+
+    Non-str dict keys and numpy types are allowed to match the behaviour of
+    json.dumps, since detector results stored as JSONB can contain numpy values.
+    """
+    return orjson.dumps(
+        obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    ).decode()